@@ -1,23 +1,72 @@
 #!/usr/bin/env python3
 # ============================================================================
 # SCRIPT: md2pdf.py
-# VERSION: 1.1
-# DATE: 2025-11-13
+# VERSION: 1.2
+# DATE: 2026-10-15
 #
 # DESCRIPTION:
 #   Markdown to PDF Converter with Serif Fonts.
 #   This script converts Markdown files to beautifully formatted PDF documents
 #   with serif fonts. It fully manages its own virtual environment and
-#   dependencies, and cleans up after itself.
+#   dependencies, which are cached between runs (or removed with --clean).
 #
 # USAGE:
-#   python md2pdf.py <path_to_markdown_file.md>
+#   python md2pdf.py [-f] [-y] [-o OUTPUT.pdf] [--clean] [--parser NAME] [-j N]
+#                    <file.md> [<file.md> ...]
 #
 # REQUIREMENTS:
 #   - Python 3.9+
 #   - Internet connection for downloading packages.
 #   - System dependencies for WeasyPrint (the script will check for them).
 #
+# CHANGELOG (v1.2):
+#   - The virtual environment is now persistent and cached under
+#     ~/.cache/md2pdf/venv-<hash>/, keyed by the Python interpreter and the
+#     required package set. Subsequent runs skip venv creation and package
+#     installation entirely. Use --clean for the old throwaway behaviour.
+#   - Conversion now runs in-process against the venv's site-packages instead
+#     of generating and spawning a temporary Python script.
+#   - Markdown can optionally be parsed with pyromark (native pulldown-cmark
+#     binding, much faster) via --parser pyromark. It has no equivalent of
+#     markdown-it's `breaks` option, so with it a single newline inside a
+#     paragraph follows CommonMark and renders as a space. The default parser
+#     is still markdown-it-py, so existing documents render unchanged.
+#   - The input file is read in a single call and decoded as UTF-8; a leading
+#     byte order mark is now stripped instead of ending up in the output.
+#   - convert_many() lets batch callers convert several files with shared
+#     setup.
+#   - A single WeasyPrint FontConfiguration is shared across conversions.
+#   - The system dependency check loads Pango/HarfBuzz directly via ctypes
+#     instead of querying dpkg, so it works on any Linux distribution and
+#     on macOS.
+#   - Dependencies are installed with a single binary-only pip invocation
+#     backed by a persistent wheel cache; pip is no longer self-upgraded.
+#   - When uv is available, it is used to create the venv and install the
+#     dependencies instead of venv + pip.
+#   - The PDF is rendered into memory and written to disk in one write.
+#   - convert_many() writes its output PDFs in batched io_uring submissions
+#     on Linux 5.6+, falling back to regular writes elsewhere.
+#   - convert_many() renders multiple files in parallel worker processes.
+#   - The HTML document is assembled by concatenation instead of replacing
+#     a placeholder, so no template token can clash with the content.
+#   - Rendered HTML is cached on disk by content hash, so unchanged markdown
+#     is not parsed again on later runs. Entries unused for 30 days are
+#     pruned automatically; ~/.cache/md2pdf/parsed/ is safe to delete.
+#   - Rarely needed standard-library modules are imported lazily to keep
+#     start-up and early exits fast.
+#   - With --clean, the venv is renamed away and deleted in the background
+#     instead of blocking the exit.
+#   - Commands are started so that subprocess can use posix_spawn() instead
+#     of fork(), which matters once WeasyPrint is loaded in-process.
+#   - The stylesheet is minified and embedded in the document's <style>
+#     block instead of being passed to WeasyPrint separately.
+#   - Embedded images are optimized and downsampled to 150 dpi, producing
+#     much smaller PDFs for image-heavy documents.
+#   - Command-line handling uses argparse: --force/-f, --yes/-y,
+#     --output/-o, --clean and --workers/-j; several input files may be
+#     given at once. Prompts are skipped automatically when not running
+#     in an interactive terminal.
+#
 # CHANGELOG (v1.1):
 #   - Fixed bug where PDF was generated without content due to incorrect
 #     f-string brace escaping in the temporary conversion script.
@@ -30,8 +79,15 @@
 
 import sys
 import os
+import argparse
+import codecs
+import errno
+import functools
+import hashlib
+import re
 import subprocess
-import tempfile
+import time
+import glob
 import shutil
 import signal
 from pathlib import Path
@@ -39,12 +95,150 @@ from pathlib import Path
 # ============================================================================
 # SCRIPT CONFIGURATION
 # ============================================================================
-SCRIPT_VERSION = "1.1"
-VENV_DIR = ".md2pdf_venv"
+SCRIPT_VERSION = "1.2"
+EPHEMERAL_VENV_DIR = ".md2pdf_venv"
+VENV_DIR = EPHEMERAL_VENV_DIR
+VENV_READY_MARKER = ".md2pdf_ready"
 REQUIRED_PACKAGES = [
     "weasyprint>=60.0",
     "markdown-it-py>=3.0.0",
+    "pyromark>=0.9",
 ]
+# "markdown-it" turns single newlines into line breaks; "pyromark" is much
+# faster but follows CommonMark, where they render as spaces.
+MARKDOWN_PARSERS = ("markdown-it", "pyromark")
+DEFAULT_MARKDOWN_PARSER = "markdown-it"
+
+# Bump whenever _markdown_to_html() output changes for the same parser
+# version (options, post-processing), so stale cached HTML is not reused.
+_HTML_RENDERER_VERSION = 2
+# Cached HTML not used for this long is removed when new entries are added.
+_PARSED_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# WeasyPrint output options: re-encode embedded images (JPEG quality 85,
+# downsampled to 150 dpi) and keep stream compression on.
+_PDF_OPTIONS = {
+    'optimize_images': True,
+    'jpeg_quality': 85,
+    'dpi': 150,
+    'uncompressed_pdf': False,
+}
+
+# Raw io_uring interface used to batch PDF writes (include/uapi/linux/io_uring.h).
+# The syscall numbers are shared by all architectures on the generic table.
+_IO_URING_SETUP = 425
+_IO_URING_ENTER = 426
+_IO_URING_ARCHES = {"x86_64", "aarch64", "riscv64"}
+_IO_URING_MAX_ENTRIES = 4096
+# File descriptors left free for everything else when sizing an io_uring
+# batch against RLIMIT_NOFILE.
+_IO_URING_FD_MARGIN = 32
+# convert_many() writes rendered PDFs in chunks of this many files, so
+# memory use does not grow with the size of the batch.
+_WRITE_BATCH_SIZE = 16
+_IORING_OFF_SQ_RING = 0
+_IORING_OFF_CQ_RING = 0x8000000
+_IORING_OFF_SQES = 0x10000000
+_IORING_OP_WRITE = 23
+_IORING_ENTER_GETEVENTS = 1
+
+# Custom CSS for professional, serif-based typography
+_CUSTOM_CSS = '''
+@page {
+    size: A4;
+    margin: 2.5cm 2cm;
+    @bottom-center {
+        content: counter(page);
+        font-family: "Liberation Serif", "Georgia", "Times New Roman", serif;
+        font-size: 10pt;
+        color: #666;
+    }
+}
+body {
+    font-family: "Liberation Serif", "Georgia", "Times New Roman", serif;
+    font-size: 11pt;
+    line-height: 1.6;
+    color: #333;
+    text-align: justify;
+    hyphens: auto;
+}
+h1, h2, h3, h4, h5, h6 {
+    font-family: "Liberation Serif", "Georgia", "Times New Roman", serif;
+    font-weight: bold;
+    color: #1a1a1a;
+    page-break-after: avoid;
+    margin-top: 1.5em;
+    margin-bottom: 0.5em;
+}
+h1 { font-size: 24pt; margin-top: 0; border-bottom: 2px solid #333; padding-bottom: 0.3em; }
+h2 { font-size: 20pt; border-bottom: 1px solid #666; padding-bottom: 0.2em; }
+h3 { font-size: 16pt; }
+h4 { font-size: 14pt; }
+p { margin: 0.8em 0; }
+a { color: #0066cc; text-decoration: none; }
+a:hover { text-decoration: underline; }
+code {
+    font-family: "Liberation Mono", "Courier New", monospace;
+    font-size: 10pt;
+    background-color: #f5f5f5;
+    padding: 0.1em 0.3em;
+    border-radius: 3px;
+    border: 1px solid #e0e0e0;
+}
+pre {
+    font-family: "Liberation Mono", "Courier New", monospace;
+    font-size: 10pt;
+    background-color: #f5f5f5;
+    padding: 1em;
+    border-radius: 5px;
+    border: 1px solid #e0e0e0;
+    overflow-x: auto;
+    page-break-inside: avoid;
+}
+pre code { background-color: transparent; padding: 0; border: none; }
+blockquote {
+    font-style: italic;
+    border-left: 4px solid #ccc;
+    margin-left: 0;
+    padding-left: 1em;
+    color: #555;
+}
+table {
+    width: 100%;
+    border-collapse: collapse;
+    margin: 1em 0;
+    font-size: 10pt;
+    page-break-inside: avoid;
+}
+th, td { padding: 0.5em; border: 1px solid #ccc; }
+th { background-color: #f0f0f0; font-weight: bold; text-align: left; }
+tr:nth-child(even) { background-color: #fafafa; }
+hr { border: none; border-top: 2px solid #ccc; margin: 2em 0; }
+img { max-width: 100%; height: auto; display: block; margin: 1em auto; }
+h1, h2, h3, h4, h5, h6 { page-break-after: avoid; }
+p, blockquote, ul, ol { orphans: 3; widows: 3; }
+'''
+
+# _CUSTOM_CSS with whitespace runs collapsed to single spaces, for embedding
+# in the document head. Spaces around `:` and `,` are kept, since they can
+# be significant in selectors (`pre :first-child`) and quoted strings.
+_MINIFIED_CSS = re.sub(r"\s+", " ", _CUSTOM_CSS).strip()
+
+# HTML document skeleton; the rendered body goes between prefix and suffix.
+# The stylesheet is embedded so WeasyPrint parses it with the document
+# instead of as a separate user stylesheet.
+_HTML_PREFIX = f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>Document</title>
+    <style>{_MINIFIED_CSS}</style>
+</head>
+<body>
+'''
+_HTML_SUFFIX = '''
+</body>
+</html>'''
 
 # ============================================================================
 # GLOBAL STATE FOR CLEANUP
@@ -55,6 +249,17 @@ cleanup_required = False
 venv_created = False
 
 
+# ============================================================================
+# EXCEPTIONS
+# ============================================================================
+class InputFileError(Exception):
+    """Raised when the input or output paths fail validation."""
+
+
+class ConversionError(Exception):
+    """Raised when rendering or writing one or more PDFs fails."""
+
+
 # ============================================================================
 # SIGNAL HANDLER for Graceful Exit
 # ============================================================================
@@ -99,6 +304,15 @@ def run_command(cmd, description, check=True, capture_output=False):
         subprocess.CompletedProcess or None: The result object if capture_output is True.
     """
     print(f"[INFO] Executing: {description}...")
+    spawn_options = {}
+    if sys.platform != "win32" and isinstance(cmd, list):
+        # subprocess only uses posix_spawn() (vfork-style, no copy of the
+        # parent's page tables) when close_fds is off and the executable is
+        # given with a directory. Our fds are non-inheritable by default, so
+        # not closing them in the child is safe.
+        spawn_options["close_fds"] = False
+        if not os.path.dirname(cmd[0]):
+            cmd = [shutil.which(cmd[0]) or cmd[0], *cmd[1:]]
     try:
         if capture_output:
             result = subprocess.run(
@@ -106,12 +320,13 @@ def run_command(cmd, description, check=True, capture_output=False):
                 check=check,
                 capture_output=True,
                 text=True,
-                encoding='utf-8'
+                encoding='utf-8',
+                **spawn_options
             )
             return result
         else:
             # For non-captured output, stream directly to the console
-            subprocess.run(cmd, check=check)
+            subprocess.run(cmd, check=check, **spawn_options)
             print(f"[SUCCESS] {description} completed.")
     except subprocess.CalledProcessError as e:
         print(f"[ERROR] Task '{description}' failed with exit code {e.returncode}!")
@@ -128,32 +343,57 @@ def run_command(cmd, description, check=True, capture_output=False):
         raise
 
 
-def check_system_packages():
+def _find_missing_libraries(sonames):
+    """
+    Tries to load each shared library and reports the ones that fail.
+
+    Args:
+        sonames (list of str): Library names to pass to the dynamic loader.
+
+    Returns:
+        list of str: The names that could not be loaded.
+    """
+    import ctypes
+
+    missing = []
+    for soname in sonames:
+        try:
+            ctypes.CDLL(soname)
+        except OSError:
+            missing.append(soname)
+    return missing
+
+
+def check_system_packages(assume_yes=False):
     """
     Checks for WeasyPrint's system-level dependencies and provides instructions.
     This is a best-effort check and may not cover all distributions.
+
+    Args:
+        assume_yes (bool): If True, continue without prompting when the
+            dependencies cannot be confirmed.
     """
     print("[INFO] Checking for WeasyPrint system dependencies...")
 
     if sys.platform.startswith('linux'):
-        # For Debian/Ubuntu-based systems
-        try:
-            result = run_command(
-                ["dpkg", "-s", "libpango-1.0-0"],
-                "Checking for Pango library on Linux",
-                capture_output=True
-            )
-            if "Status: install ok installed" in result.stdout:
-                print("[SUCCESS] Found required system libraries for Linux.")
-                return
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            # dpkg might not be present or the package is not found
-            pass # Fall through to the warning
-        print("[WARNING] Could not confirm all system dependencies for WeasyPrint.")
+        # Load the shared libraries WeasyPrint itself will use. This works on
+        # any distribution, not only those with dpkg.
+        missing = _find_missing_libraries(
+            ["libpango-1.0.so.0", "libpangoft2-1.0.so.0", "libharfbuzz.so.0"]
+        )
+        if not missing:
+            print("[SUCCESS] Found required system libraries for Linux.")
+            return
+        print(f"[WARNING] Could not load: {', '.join(missing)}")
         print("[WARNING] On Debian/Ubuntu, please ensure these are installed:")
         print("  sudo apt update && sudo apt install -y libpango-1.0-0 libpangoft2-1.0-0 libharfbuzz-subset0")
 
     elif sys.platform == 'darwin': # macOS
+        missing = _find_missing_libraries(["libpango-1.0.0.dylib"])
+        if not missing:
+            print("[SUCCESS] Found required system libraries for macOS.")
+            return
+        print(f"[WARNING] Could not load: {', '.join(missing)}")
         if shutil.which("brew"):
             print("[INFO] For macOS, WeasyPrint requires Pango, Cairo, and libffi.")
             print("[INFO] These can be installed with Homebrew:")
@@ -169,15 +409,73 @@ def check_system_packages():
     else:
         print(f"[WARNING] Unsupported platform '{sys.platform}'. Please install WeasyPrint's system dependencies manually.")
 
+    if assume_yes:
+        print("[INFO] Continuing anyway (--yes).")
+        return
     response = input("Do you want to continue anyway? (y/N): ")
     if response.lower() != 'y':
         print("[INFO] Exiting. Please install required packages first.")
         sys.exit(1)
 
 
-def create_virtual_environment():
-    """Creates a clean virtual environment for isolated package installation."""
-    global venv_created
+def _cache_root():
+    """Returns the md2pdf cache directory, honouring XDG_CACHE_HOME."""
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return cache_home / "md2pdf"
+
+
+def _venv_cache_dir():
+    """
+    Returns the persistent venv location for this interpreter and package set.
+
+    One venv is kept per (python, package-set) pair, so changing either
+    REQUIRED_PACKAGES or the interpreter running this script yields a fresh
+    cache directory instead of reusing an incompatible one. The key covers
+    the interpreter's version as well as its path, so an in-place upgrade
+    (e.g. /usr/bin/python3 moving to a new minor version) doesn't load
+    extension modules built for the old one.
+
+    Returns:
+        pathlib.Path: The cache directory for the virtual environment.
+    """
+    key = ":".join([sys.executable, sys.implementation.cache_tag, sys.version, *REQUIRED_PACKAGES]).encode()
+    digest = hashlib.blake2b(key).hexdigest()[:16]
+    return _cache_root() / f"venv-{digest}"
+
+
+def create_virtual_environment(persistent=True):
+    """
+    Prepares the virtual environment used for the conversion.
+
+    In persistent mode (the default), a cached venv is reused if its ready
+    marker exists. Otherwise a new one is built in a private sibling
+    directory and moved into place by mark_environment_ready(), so
+    concurrent runs on a cold cache never delete each other's work.
+    In ephemeral mode (--clean), a throwaway venv is created in the current
+    directory and removed again at exit.
+
+    Args:
+        persistent (bool): Whether to use the cached venv.
+
+    Returns:
+        bool: True if dependencies still need to be installed.
+    """
+    global VENV_DIR, venv_created, cleanup_required
+    if persistent:
+        cache_dir = str(_venv_cache_dir())
+        if os.path.exists(os.path.join(cache_dir, VENV_READY_MARKER)):
+            VENV_DIR = cache_dir
+            cleanup_required = False
+            print(f"[SUCCESS] Reusing cached virtual environment at '{VENV_DIR}'")
+            return False
+        os.makedirs(os.path.dirname(cache_dir), exist_ok=True)
+        # Named after our PID, so an existing directory can only be left
+        # over from a dead process. It is removed again if the build fails.
+        VENV_DIR = f"{cache_dir}.tmp-{os.getpid()}"
+    else:
+        VENV_DIR = EPHEMERAL_VENV_DIR
+    cleanup_required = True
+
     if os.path.exists(VENV_DIR):
         print(f"[INFO] Removing existing virtual environment at '{VENV_DIR}'...")
         try:
@@ -186,12 +484,46 @@ def create_virtual_environment():
             print(f"[ERROR] Failed to remove existing venv: {e}")
             print("[ERROR] Please remove the directory manually and try again.")
             raise
-    run_command(
-        [sys.executable, "-m", "venv", VENV_DIR],
-        "Creating virtual environment"
-    )
+    if shutil.which("uv"):
+        run_command(
+            ["uv", "venv", VENV_DIR, "--python", sys.executable],
+            "Creating virtual environment with uv"
+        )
+    else:
+        run_command(
+            [sys.executable, "-m", "venv", VENV_DIR],
+            "Creating virtual environment"
+        )
     venv_created = True
     print(f"[SUCCESS] Virtual environment created at '{VENV_DIR}'")
+    return True
+
+
+def mark_environment_ready():
+    """
+    Marks the freshly built venv ready and moves it to its cache location.
+
+    The rename is atomic, so other runs either see no cached venv or a
+    complete one. If another run got there first, its venv is used and
+    ours is discarded. The venv is only used through its site-packages
+    after this point, so the build paths baked into its bin/ scripts
+    don't matter.
+    """
+    global VENV_DIR, cleanup_required
+    Path(VENV_DIR, VENV_READY_MARKER).touch()
+    cache_dir = str(_venv_cache_dir())
+    try:
+        os.rename(VENV_DIR, cache_dir)
+    except OSError:
+        if not os.path.exists(os.path.join(cache_dir, VENV_READY_MARKER)):
+            print(f"[ERROR] Could not move the new virtual environment to '{cache_dir}'.")
+            print("[ERROR] Please remove that directory manually and try again.")
+            raise
+        print("[INFO] Another run already cached this environment; using it instead.")
+        _remove_directory_in_background(VENV_DIR)
+    VENV_DIR = cache_dir
+    cleanup_required = False
+    print(f"[SUCCESS] Cached virtual environment at '{VENV_DIR}'")
 
 
 def get_venv_executable(name):
@@ -210,17 +542,38 @@ def get_venv_executable(name):
 
 
 def install_dependencies():
-    """Installs required Python packages into the virtual environment."""
+    """
+    Installs required Python packages into the virtual environment.
+
+    Uses `uv pip` when uv is on the PATH, since it resolves and installs
+    from its own global cache much faster than pip. Otherwise falls back
+    to the venv's pip.
+    """
+    if shutil.which("uv"):
+        run_command(
+            [
+                "uv", "pip", "install",
+                "--python", get_venv_executable("python"),
+                "--only-binary", ":all:",
+                *REQUIRED_PACKAGES,
+            ],
+            f"Installing {', '.join(REQUIRED_PACKAGES)} with uv"
+        )
+        print("[SUCCESS] All Python dependencies installed successfully.")
+        return
+
     pip_path = get_venv_executable("pip")
     run_command(
-        [pip_path, "install", "--upgrade", "pip"],
-        "Upgrading pip"
+        [
+            pip_path, "install",
+            "--disable-pip-version-check",
+            "--no-input",
+            "--only-binary=:all:",
+            "--cache-dir", str(_cache_root() / "pip-wheels"),
+            *REQUIRED_PACKAGES,
+        ],
+        f"Installing {', '.join(REQUIRED_PACKAGES)}"
     )
-    for package in REQUIRED_PACKAGES:
-        run_command(
-            [pip_path, "install", package],
-            f"Installing {package}"
-        )
     print("[SUCCESS] All Python dependencies installed successfully.")
 
 
@@ -247,168 +600,577 @@ def validate_markdown_file(filepath):
     return path
 
 
-def convert_markdown_to_pdf(md_path, output_path):
+def _activate_venv():
+    """
+    Makes the venv's site-packages importable from this interpreter.
+
+    The venv is created from sys.executable, so its compiled packages are
+    binary-compatible with the running process and can be imported directly
+    instead of through a second Python subprocess.
+    """
+    if sys.platform == "win32":
+        candidates = glob.glob(os.path.join(VENV_DIR, "Lib", "site-packages"))
+    else:
+        candidates = glob.glob(os.path.join(VENV_DIR, "lib", "python*", "site-packages"))
+    if not candidates:
+        raise FileNotFoundError(f"No site-packages directory found in '{VENV_DIR}'.")
+    site_packages = os.path.abspath(candidates[0])
+    if site_packages not in sys.path:
+        sys.path.insert(0, site_packages)
+
+
+def _markdown_to_html(md_content, parser=DEFAULT_MARKDOWN_PARSER):
+    """
+    Converts markdown text to HTML.
+
+    Both parsers render tables, strikethrough and raw HTML. markdown-it-py
+    turns single newlines into line breaks. pyromark, a native
+    pulldown-cmark binding, is much faster but treats them as soft breaks,
+    as in standard CommonMark, so they render as spaces.
+
+    Args:
+        md_content (str): The markdown source.
+        parser (str): One of MARKDOWN_PARSERS.
+
+    Returns:
+        str: The rendered HTML fragment.
+    """
+    if parser == "markdown-it":
+        from markdown_it import MarkdownIt
+        md = MarkdownIt('commonmark', {'breaks': True, 'html': True}).enable(['table', 'strikethrough'])
+        return md.render(md_content)
+
+    import pyromark
+
+    options = pyromark.Options.ENABLE_TABLES | pyromark.Options.ENABLE_STRIKETHROUGH
+    return pyromark.html(md_content, options=options)
+
+
+def _write_file(path, data):
+    """
+    Writes a complete in-memory file to disk with as few syscalls as possible.
+
+    Args:
+        path (str or pathlib.Path): The destination file, truncated if it exists.
+        data (bytes): The file contents.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=1)
+def _io_uring_params_type():
+    """
+    Builds the ctypes layout of `struct io_uring_params`.
+
+    Defined lazily so ctypes is only imported when io_uring is used.
+
+    Returns:
+        type: A ctypes.Structure subclass for io_uring_setup().
+    """
+    import ctypes
+
+    class IoSqringOffsets(ctypes.Structure):
+        _fields_ = [(name, ctypes.c_uint32) for name in (
+            "head", "tail", "ring_mask", "ring_entries", "flags", "dropped", "array", "resv1"
+        )] + [("user_addr", ctypes.c_uint64)]
+
+    class IoCqringOffsets(ctypes.Structure):
+        _fields_ = [(name, ctypes.c_uint32) for name in (
+            "head", "tail", "ring_mask", "ring_entries", "overflow", "cqes", "flags", "resv1"
+        )] + [("user_addr", ctypes.c_uint64)]
+
+    class IoUringParams(ctypes.Structure):
+        _fields_ = [(name, ctypes.c_uint32) for name in (
+            "sq_entries", "cq_entries", "flags", "sq_thread_cpu", "sq_thread_idle", "features", "wq_fd"
+        )] + [
+            ("resv", ctypes.c_uint32 * 3),
+            ("sq_off", IoSqringOffsets),
+            ("cq_off", IoCqringOffsets),
+        ]
+
+    return IoUringParams
+
+
+def _io_uring_supported():
+    """
+    Checks whether the raw io_uring interface can be used on this system.
+
+    IORING_OP_WRITE needs Linux 5.6+, and the syscall numbers are only
+    hard-coded for architectures that use the generic syscall table.
+
+    Returns:
+        bool: True if _write_files_io_uring() may be attempted.
+    """
+    if not sys.platform.startswith("linux") or os.uname().machine not in _IO_URING_ARCHES:
+        return False
+    try:
+        major, minor = (int(part) for part in os.uname().release.split(".")[:2])
+    except ValueError:
+        return False
+    return (major, minor) >= (5, 6)
+
+
+def _io_uring_fd_budget():
+    """
+    Returns how many output files may be open at once for an io_uring batch.
+
+    Each queued write holds its file open until the batch completes, so
+    batches are capped by the soft RLIMIT_NOFILE, minus the descriptors
+    already in use and _IO_URING_FD_MARGIN.
+
+    Returns:
+        int: The maximum batch size, at least 1.
+    """
+    import resource
+
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY:
+        return _IO_URING_MAX_ENTRIES
+    try:
+        open_fds = len(os.listdir("/proc/self/fd"))
+    except OSError:
+        open_fds = 0
+    return max(1, soft - open_fds - _IO_URING_FD_MARGIN)
+
+
+def _write_files_io_uring(jobs):
+    """
+    Writes several in-memory files through a single io_uring submission.
+
+    The files are opened up front, one IORING_OP_WRITE is queued per file
+    and the whole batch is submitted and reaped with one io_uring_enter
+    call, instead of one write() syscall per file. Batches are limited by
+    the ring size and by _io_uring_fd_budget().
+
+    Args:
+        jobs (list of (path, bytes)): The destination files and their contents.
+
+    Returns:
+        list of (path, bytes): Jobs that were not fully written and should be
+        retried with _write_file().
+
+    Raises:
+        OSError: If the io_uring instance cannot be set up.
+    """
+    import ctypes
+    import mmap
+    import struct
+
+    libc = ctypes.CDLL(None, use_errno=True)
+    libc.syscall.restype = ctypes.c_long
+    batch_size = min(len(jobs), _io_uring_fd_budget(), _IO_URING_MAX_ENTRIES)
+    entries = 1 << (batch_size - 1).bit_length()
+    params = _io_uring_params_type()()
+    ring_fd = libc.syscall(_IO_URING_SETUP, ctypes.c_uint(entries), ctypes.byref(params))
+    if ring_fd < 0:
+        err = ctypes.get_errno()
+        raise OSError(err, f"io_uring_setup failed: {os.strerror(err)}")
+
+    failed = []
+    mappings = []
+    try:
+        sq_off, cq_off = params.sq_off, params.cq_off
+        sq_ring = mmap.mmap(ring_fd, sq_off.array + params.sq_entries * 4, offset=_IORING_OFF_SQ_RING)
+        mappings.append(sq_ring)
+        cq_ring = mmap.mmap(ring_fd, cq_off.cqes + params.cq_entries * 16, offset=_IORING_OFF_CQ_RING)
+        mappings.append(cq_ring)
+        sqes = mmap.mmap(ring_fd, params.sq_entries * 64, offset=_IORING_OFF_SQES)
+        mappings.append(sqes)
+
+        batch_size = min(batch_size, params.sq_entries)
+        for start in range(0, len(jobs), batch_size):
+            batch = jobs[start:start + batch_size]
+            fds = []
+            try:
+                sq_tail = struct.unpack_from("=I", sq_ring, sq_off.tail)[0]
+                queued = 0
+                for index, (path, data) in enumerate(batch):
+                    try:
+                        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                    except OSError:
+                        # Left for _write_file(), which reports the error.
+                        failed.append((path, data))
+                        continue
+                    fds.append(fd)
+                    # Points straight at the bytes object's buffer; `batch`
+                    # keeps it alive until the write has completed.
+                    address = ctypes.cast(ctypes.c_char_p(data), ctypes.c_void_p).value
+                    slot = (sq_tail + queued) & (params.sq_entries - 1)
+                    queued += 1
+                    sqes[slot * 64:(slot + 1) * 64] = bytes(64)
+                    struct.pack_into(
+                        "=BBHiQQIIQ", sqes, slot * 64,
+                        _IORING_OP_WRITE, 0, 0, fd, 0, address, len(data), 0, index
+                    )
+                    struct.pack_into("=I", sq_ring, sq_off.array + slot * 4, slot)
+                struct.pack_into("=I", sq_ring, sq_off.tail, sq_tail + queued)
+
+                to_submit = queued
+                completed = 0
+                while completed < queued:
+                    ret = libc.syscall(
+                        _IO_URING_ENTER, ring_fd, to_submit, queued - completed,
+                        _IORING_ENTER_GETEVENTS, None, 0
+                    )
+                    if ret < 0:
+                        err = ctypes.get_errno()
+                        if err == errno.EINTR:
+                            continue
+                        raise OSError(err, f"io_uring_enter failed: {os.strerror(err)}")
+                    to_submit = max(to_submit - ret, 0)
+                    cq_head = struct.unpack_from("=I", cq_ring, cq_off.head)[0]
+                    cq_tail = struct.unpack_from("=I", cq_ring, cq_off.tail)[0]
+                    while cq_head != cq_tail:
+                        slot = cq_head & (params.cq_entries - 1)
+                        user_data, res = struct.unpack_from("=Qi", cq_ring, cq_off.cqes + slot * 16)
+                        path, data = batch[user_data]
+                        if res != len(data):
+                            failed.append((path, data))
+                        cq_head = (cq_head + 1) & 0xFFFFFFFF
+                        completed += 1
+                    struct.pack_into("=I", cq_ring, cq_off.head, cq_head)
+            finally:
+                for fd in fds:
+                    os.close(fd)
+    finally:
+        for mapping in mappings:
+            mapping.close()
+        os.close(ring_fd)
+    return failed
+
+
+def _write_files(jobs):
     """
-    Converts the markdown file to a PDF using a temporary, isolated script
-    that runs within the virtual environment.
+    Writes several in-memory files, batching them through io_uring when the
+    platform supports it and falling back to _write_file() otherwise.
+
+    Args:
+        jobs (list of (path, bytes)): The destination files and their contents.
+
+    Returns:
+        list of path: The files that could not be written; each failure is
+        reported as it happens and does not stop the remaining writes.
+    """
+    pending = jobs
+    if len(jobs) > 1 and _io_uring_supported():
+        try:
+            pending = _write_files_io_uring(jobs)
+        except OSError as e:
+            print(f"[WARNING] io_uring write failed ({e}); using regular writes instead.")
+    failed = []
+    for path, data in pending:
+        try:
+            _write_file(path, data)
+        except OSError as e:
+            print(f"[ERROR] Failed to write {path}: {e}")
+            failed.append(path)
+    return failed
+
+
+@functools.lru_cache(maxsize=1)
+def _get_font_config():
+    """
+    Returns the WeasyPrint font configuration shared by all conversions.
+
+    Reusing one instance keeps resolved fonts cached across documents
+    instead of looking them up again for every PDF.
+
+    Returns:
+        weasyprint.text.fonts.FontConfiguration: The shared configuration.
+    """
+    from weasyprint.text.fonts import FontConfiguration
+    return FontConfiguration()
+
+
+def _parser_version(parser):
+    """
+    Returns the installed version of a markdown parser package.
+
+    Args:
+        parser (str): One of MARKDOWN_PARSERS.
+
+    Returns:
+        str: The package's __version__.
+    """
+    if parser == "markdown-it":
+        import markdown_it
+        return markdown_it.__version__
+    import pyromark
+    return pyromark.__version__
+
+
+def _prune_parsed_cache(cache_dir):
+    """
+    Removes cached HTML entries that have not been used recently.
+
+    Entries are touched on every hit, so only HTML for documents that were
+    not converted within _PARSED_CACHE_MAX_AGE is deleted. Errors are
+    ignored, since another run may be pruning at the same time.
+
+    Args:
+        cache_dir (pathlib.Path): The parsed-HTML cache directory.
+    """
+    cutoff = time.time() - _PARSED_CACHE_MAX_AGE
+    for entry in cache_dir.glob("*/*.html"):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+        except OSError:
+            pass
+
+
+def _parse_cached(md_bytes, parser=DEFAULT_MARKDOWN_PARSER):
+    """
+    Converts markdown bytes to HTML, reusing a previous result if available.
+
+    Rendered HTML is stored under ~/.cache/md2pdf/parsed/, keyed by a hash
+    of the markdown source, the parser and its installed version,
+    _HTML_RENDERER_VERSION, the script version and the package set. An
+    unchanged document is therefore never parsed twice, e.g. when only the
+    output is regenerated after an edit-save cycle. Entries unused for
+    _PARSED_CACHE_MAX_AGE are pruned whenever a new one is written; the
+    directory is safe to delete at any time.
+
+    Args:
+        md_bytes (bytes): The raw contents of the markdown file.
+        parser (str): One of MARKDOWN_PARSERS.
+
+    Returns:
+        str: The rendered HTML fragment.
+    """
+    key_parts = [
+        SCRIPT_VERSION.encode(),
+        parser.encode(),
+        _parser_version(parser).encode(),
+        str(_HTML_RENDERER_VERSION).encode(),
+        *(package.encode() for package in REQUIRED_PACKAGES),
+        md_bytes,
+    ]
+    key = hashlib.sha256(b"\0".join(key_parts)).hexdigest()
+    cache_dir = _cache_root() / "parsed"
+    cache_path = cache_dir / key[:2] / f"{key}.html"
+    try:
+        html_content = cache_path.read_bytes().decode('utf-8')
+        os.utime(cache_path)
+        print("[INFO] Using cached HTML for unchanged markdown.")
+        return html_content
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    print("[INFO] Parsing markdown to HTML...")
+    if md_bytes.startswith(codecs.BOM_UTF8):
+        md_bytes = md_bytes[len(codecs.BOM_UTF8):]
+    html_content = _markdown_to_html(md_bytes.decode('utf-8'), parser)
+
+    # Write to a private temporary name and rename it into place, so
+    # concurrent conversions never see a partially written cache entry.
+    # The cache is an optimisation only, so failing to write it is ignored.
+    temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_file(temp_path, html_content.encode('utf-8'))
+        os.replace(temp_path, cache_path)
+    except OSError:
+        try:
+            temp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+    _prune_parsed_cache(cache_dir)
+    return html_content
+
+
+def _render_pdf(md_path, parser=DEFAULT_MARKDOWN_PARSER):
+    """
+    Renders a markdown file to PDF bytes with WeasyPrint.
+
+    Must be called after _activate_venv() so the packages are importable.
+    WeasyPrint and the markdown parser are imported here rather than at
+    module level, so --help, input errors and a declined overwrite prompt
+    exit without loading them.
+
+    Args:
+        md_path (pathlib.Path): Path to the source markdown file.
+        parser (str): One of MARKDOWN_PARSERS.
+
+    Returns:
+        bytes: The generated PDF document.
+    """
+    from weasyprint import HTML
+
+    print(f"[INFO] Reading content from {md_path}...")
+    md_bytes = Path(md_path).read_bytes()
+    html_content = _parse_cached(md_bytes, parser)
+    full_html = "".join((_HTML_PREFIX, html_content, _HTML_SUFFIX))
+
+    print(f"[INFO] Generating PDF with WeasyPrint from {md_path}")
+    return HTML(string=full_html).write_pdf(font_config=_get_font_config(), **_PDF_OPTIONS)
+
+
+def _render(md_path, output_path, parser=DEFAULT_MARKDOWN_PARSER):
+    """
+    Renders a markdown file to PDF and writes it to disk.
 
     Args:
         md_path (pathlib.Path): Path to the source markdown file.
         output_path (pathlib.Path): Path for the generated PDF file.
+        parser (str): One of MARKDOWN_PARSERS.
     """
-    python_path = get_venv_executable("python")
-
-    # This script will be executed by the venv's Python interpreter,
-    # ensuring it uses the packages we just installed.
-    #
-    # *** CRITICAL BUG FIX ***
-    # The original script had a bug here. In an f-string, `{{` escapes to a
-    # literal `{`. The original template placeholder `{{content}}` became
-    # `{content}` in the generated script, which was not what the `.replace()`
-    # call was looking for.
-    # To get a literal `{{content}}` into the generated script, we must use
-    # `{{{{content}}}}` in this outer f-string.
-    conversion_script = f"""
-import sys
-from markdown_it import MarkdownIt
-from weasyprint import HTML, CSS
+    pdf_data = _render_pdf(md_path, parser)
+    print(f"[INFO] Writing PDF -> {output_path}")
+    _write_file(output_path, pdf_data)
+    print("[SUCCESS] PDF generation complete.")
 
-try:
-    # Configure markdown parser with common extensions
-    md = MarkdownIt('commonmark', {{'breaks': True, 'html': True}}).enable(['table', 'strikethrough'])
 
-    # Read markdown content from the source file
-    md_filepath = r'{md_path}'
-    print(f"[INFO] Reading content from {{md_filepath}}...")
-    with open(md_filepath, 'r', encoding='utf-8') as f:
-        md_content = f.read()
+def convert_markdown_to_pdf(md_path, output_path, parser=DEFAULT_MARKDOWN_PARSER):
+    """
+    Converts the markdown file to a PDF in-process, using the packages
+    installed in the virtual environment.
 
-    print("[INFO] Parsing markdown to HTML...")
-    html_content = md.render(md_content)
+    Args:
+        md_path (pathlib.Path): Path to the source markdown file.
+        output_path (pathlib.Path): Path for the generated PDF file.
+        parser (str): One of MARKDOWN_PARSERS.
 
-    # Create a complete HTML document with beautiful serif styling
-    # Note the placeholder `{{{{content}}}}` which will be replaced.
-    html_template = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <title>Document</title>
-</head>
-<body>
-{{{{content}}}}
-</body>
-</html>'''
+    Raises:
+        ConversionError: If the venv cannot be activated or rendering or
+            writing the PDF fails.
+    """
+    print("[INFO] Executing: Converting Markdown to PDF...")
+    try:
+        _activate_venv()
+        _render(md_path, output_path, parser)
+    except Exception as e:
+        raise ConversionError(f"{md_path.name}: {type(e).__name__}: {e}") from e
+    print("[SUCCESS] Converting Markdown to PDF completed.")
 
-    full_html = html_template.replace('{{{{content}}}}', html_content)
-
-    # Custom CSS for professional, serif-based typography
-    custom_css = '''
-    @page {{
-        size: A4;
-        margin: 2.5cm 2cm;
-        @bottom-center {{
-            content: counter(page);
-            font-family: "Liberation Serif", "Georgia", "Times New Roman", serif;
-            font-size: 10pt;
-            color: #666;
-        }}
-    }}
-    body {{
-        font-family: "Liberation Serif", "Georgia", "Times New Roman", serif;
-        font-size: 11pt;
-        line-height: 1.6;
-        color: #333;
-        text-align: justify;
-        hyphens: auto;
-    }}
-    h1, h2, h3, h4, h5, h6 {{
-        font-family: "Liberation Serif", "Georgia", "Times New Roman", serif;
-        font-weight: bold;
-        color: #1a1a1a;
-        page-break-after: avoid;
-        margin-top: 1.5em;
-        margin-bottom: 0.5em;
-    }}
-    h1 {{ font-size: 24pt; margin-top: 0; border-bottom: 2px solid #333; padding-bottom: 0.3em; }}
-    h2 {{ font-size: 20pt; border-bottom: 1px solid #666; padding-bottom: 0.2em; }}
-    h3 {{ font-size: 16pt; }}
-    h4 {{ font-size: 14pt; }}
-    p {{ margin: 0.8em 0; }}
-    a {{ color: #0066cc; text-decoration: none; }}
-    a:hover {{ text-decoration: underline; }}
-    code {{
-        font-family: "Liberation Mono", "Courier New", monospace;
-        font-size: 10pt;
-        background-color: #f5f5f5;
-        padding: 0.1em 0.3em;
-        border-radius: 3px;
-        border: 1px solid #e0e0e0;
-    }}
-    pre {{
-        font-family: "Liberation Mono", "Courier New", monospace;
-        font-size: 10pt;
-        background-color: #f5f5f5;
-        padding: 1em;
-        border-radius: 5px;
-        border: 1px solid #e0e0e0;
-        overflow-x: auto;
-        page-break-inside: avoid;
-    }}
-    pre code {{ background-color: transparent; padding: 0; border: none; }}
-    blockquote {{
-        font-style: italic;
-        border-left: 4px solid #ccc;
-        margin-left: 0;
-        padding-left: 1em;
-        color: #555;
-    }}
-    table {{
-        width: 100%;
-        border-collapse: collapse;
-        margin: 1em 0;
-        font-size: 10pt;
-        page-break-inside: avoid;
-    }}
-    th, td {{ padding: 0.5em; border: 1px solid #ccc; }}
-    th {{ background-color: #f0f0f0; font-weight: bold; text-align: left; }}
-    tr:nth-child(even) {{ background-color: #fafafa; }}
-    hr {{ border: none; border-top: 2px solid #ccc; margin: 2em 0; }}
-    img {{ max-width: 100%; height: auto; display: block; margin: 1em auto; }}
-    h1, h2, h3, h4, h5, h6 {{ page-break-after: avoid; }}
-    p, blockquote, ul, ol {{ orphans: 3; widows: 3; }}
-    '''
-
-    output_filepath = r'{output_path}'
-    print(f"[INFO] Generating PDF with WeasyPrint -> {{output_filepath}}")
-    HTML(string=full_html).write_pdf(
-        output_filepath,
-        stylesheets=[CSS(string=custom_css)]
-    )
+
+def _init_worker(venv_dir):
+    """
+    Prepares a conversion worker process to import the venv's packages.
+
+    Workers ignore Ctrl+C, so the parent alone handles the interrupt and
+    runs cleanup_environment(); forked workers would otherwise inherit
+    signal_handler and all try to remove the venv at once.
+
+    Args:
+        venv_dir (str): The parent's VENV_DIR, which a spawned worker
+            would otherwise not inherit.
+    """
+    global VENV_DIR
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    VENV_DIR = venv_dir
+    _activate_venv()
+
+
+def convert_many(paths, workers=None, parser=DEFAULT_MARKDOWN_PARSER):
+    """
+    Converts several markdown files to PDFs next to their sources.
+
+    A single file is converted in-process. With more than one input, the
+    files are rendered in parallel by a process pool whose workers each
+    import WeasyPrint and set up fonts once. Rendered PDFs are written via
+    _write_files() in chunks of _WRITE_BATCH_SIZE as they arrive, so only
+    a bounded number are held in memory at a time. A document that
+    fails to render does not stop the others: every PDF that rendered is
+    written before the failures are reported.
+
+    Args:
+        paths (iterable of str or pathlib.Path): The markdown files to convert.
+        workers (int, optional): Maximum number of worker processes.
+            Defaults to the number of CPUs.
+        parser (str): One of MARKDOWN_PARSERS.
+
+    Returns:
+        list of pathlib.Path: The generated PDF files, in input order.
+
+    Raises:
+        ConversionError: If any file failed to render or be written. The
+            other files are still converted.
+    """
+    md_paths = [Path(path) for path in paths]
+    outputs = [md_path.with_suffix('.pdf') for md_path in md_paths]
+    if len(md_paths) == 1:
+        convert_markdown_to_pdf(md_paths[0], outputs[0], parser)
+        return outputs
+
+    # Imported here so single-file runs and early exits don't pay for it.
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    max_workers = min(workers or os.cpu_count() or 1, len(md_paths))
+    print(f"[INFO] Rendering {len(md_paths)} files with {max_workers} worker processes...")
+    jobs = []
+    failed = []
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(VENV_DIR,)
+    ) as executor:
+        futures = {executor.submit(_render_pdf, md_path, parser): index for index, md_path in enumerate(md_paths)}
+        for future in as_completed(futures):
+            # Dropping the future releases its result once it is written.
+            index = futures.pop(future)
+            try:
+                jobs.append((outputs[index], future.result()))
+            except Exception as e:
+                print(f"[ERROR] Failed to render {md_paths[index].name}: {type(e).__name__}: {e}")
+                failed.append(md_paths[index].name)
+                continue
+            print(f"[SUCCESS] Rendered {md_paths[index].name}")
+            if len(jobs) >= _WRITE_BATCH_SIZE:
+                print(f"[INFO] Writing {len(jobs)} PDF files...")
+                failed.extend(Path(path).name for path in _write_files(jobs))
+                jobs = []
+
+    if jobs:
+        print(f"[INFO] Writing {len(jobs)} PDF files...")
+        failed.extend(Path(path).name for path in _write_files(jobs))
+    if failed:
+        raise ConversionError(f"{len(failed)} of {len(md_paths)} files failed: {', '.join(failed)}")
     print("[SUCCESS] PDF generation complete.")
+    return outputs
 
-except Exception as e:
-    import traceback
-    print(f"[ERROR] PDF conversion failed inside the temporary script.")
-    print(f"[ERROR] {{type(e).__name__}}: {{e}}")
-    traceback.print_exc()
-    sys.exit(1) # Ensure the subprocess exits with an error code
-"""
 
-    # Write the conversion script to a temporary file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False, encoding='utf-8') as f:
-        temp_script_path = f.name
-        f.write(conversion_script)
+def _remove_directory_in_background(path):
+    """
+    Removes a directory without waiting for the deletion to finish.
+
+    The directory is first renamed to a unique trash path, which is atomic,
+    so the original path is gone immediately. The trash path is then
+    deleted by a detached child process. If the rename fails, the directory
+    is deleted synchronously instead.
 
+    Args:
+        path (str): The directory to remove.
+    """
+    trash = f"{path}.trash-{os.getpid()}"
     try:
-        # Execute the temporary script using the venv's Python
-        run_command(
-            [python_path, temp_script_path],
-            "Converting Markdown to PDF"
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path)
+        return
+
+    if hasattr(os, "fork"):
+        if os.fork() == 0:
+            try:
+                os.setsid()
+                shutil.rmtree(trash, ignore_errors=True)
+            finally:
+                os._exit(0)
+    elif sys.platform == "win32":
+        subprocess.Popen(
+            ["cmd", "/c", "rmdir", "/s", "/q", trash],
+            creationflags=subprocess.DETACHED_PROCESS,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
         )
-    finally:
-        # Ensure the temporary script is always cleaned up
-        if os.path.exists(temp_script_path):
-            os.unlink(temp_script_path)
+    else:
+        shutil.rmtree(trash)
 
 
 def cleanup_environment():
@@ -420,7 +1182,7 @@ def cleanup_environment():
     print("\n--- [CLEANUP] Removing virtual environment ---")
     if os.path.exists(VENV_DIR):
         try:
-            shutil.rmtree(VENV_DIR)
+            _remove_directory_in_background(VENV_DIR)
             print(f"[SUCCESS] Removed virtual environment: '{VENV_DIR}'")
         except Exception as e:
             print(f"[WARNING] Failed to remove virtual environment: {e}")
@@ -430,31 +1192,104 @@ def cleanup_environment():
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
+def parse_arguments(argv=None):
+    """
+    Parses the command-line arguments.
+
+    When not attached to an interactive terminal, --yes and --force are
+    implied so the script never blocks on a prompt under CI or in pipelines.
+
+    Args:
+        argv (list of str, optional): Arguments to parse. Defaults to sys.argv[1:].
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    script_name = Path(__file__).name
+    parser = argparse.ArgumentParser(
+        prog=script_name,
+        description="Converts Markdown files to styled PDFs.",
+        epilog=f"Example:\n  python {script_name} my-document.md",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "inputs", nargs="+", metavar="FILE",
+        help="Markdown file(s) to convert; each PDF is written next to its source."
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path,
+        help="Output PDF path (only valid with a single input file)."
+    )
+    parser.add_argument(
+        "-f", "--force", action="store_true",
+        help="Overwrite existing PDF files without asking."
+    )
+    parser.add_argument(
+        "-y", "--yes", action="store_true",
+        help="Continue without asking if system dependencies cannot be confirmed."
+    )
+    parser.add_argument(
+        "--clean", action="store_true",
+        help="Use a throwaway virtual environment and remove it afterwards."
+    )
+    parser.add_argument(
+        "--parser", choices=MARKDOWN_PARSERS, default=DEFAULT_MARKDOWN_PARSER,
+        help=(
+            "Markdown parser (default: %(default)s). pyromark is much faster but "
+            "renders single newlines as spaces instead of line breaks."
+        )
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int,
+        help="Worker processes for multiple inputs (default: number of CPUs)."
+    )
+    args = parser.parse_args(argv)
+
+    if args.output is not None and len(args.inputs) > 1:
+        parser.error("--output can only be used with a single input file.")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1.")
+    if not (sys.stdin.isatty() and sys.stdout.isatty()):
+        args.yes = True
+        args.force = True
+    return args
+
+
 def main():
     """Main execution function to orchestrate the conversion process."""
-    global cleanup_required
     total_steps = 6
+    args = parse_arguments()
 
     print_header(f"Markdown to PDF Converter v{SCRIPT_VERSION}")
 
-    # Check command-line arguments
-    if len(sys.argv) != 2 or sys.argv[1] in ("-h", "--help"):
-        print("Converts a Markdown file to a styled PDF.")
-        print(f"\nUsage: python {Path(__file__).name} <path_to_markdown_file.md>")
-        print("\nExample:")
-        print(f"  python {Path(__file__).name} my-document.md")
-        sys.exit(0)
-
-    md_file_arg = sys.argv[1]
-
     try:
         # STEP 1: Validate input file and check for overwrite
         print_step(1, total_steps, "Validating Input and Output Files")
-        md_path = validate_markdown_file(md_file_arg)
-        output_pdf_path = md_path.with_suffix('.pdf')
-
-        if output_pdf_path.exists():
+        try:
+            md_paths = [validate_markdown_file(md_file_arg) for md_file_arg in args.inputs]
+            if args.output is not None:
+                output_pdf_paths = [args.output]
+            else:
+                output_pdf_paths = [md_path.with_suffix('.pdf') for md_path in md_paths]
+
+            # Two inputs writing the same PDF (e.g. `a.md a.markdown`, or one
+            # file given twice) would race on the output file.
+            seen_outputs = set()
+            for output_pdf_path in output_pdf_paths:
+                resolved = output_pdf_path.resolve()
+                if resolved in seen_outputs:
+                    raise ValueError(f"More than one input would be written to '{output_pdf_path}'.")
+                seen_outputs.add(resolved)
+        except (FileNotFoundError, PermissionError, ValueError) as e:
+            raise InputFileError(e) from e
+
+        for output_pdf_path in output_pdf_paths:
+            if not output_pdf_path.exists():
+                continue
             print(f"[WARNING] Output file '{output_pdf_path.name}' already exists.")
+            if args.force:
+                print("[INFO] The existing file will be overwritten (--force).")
+                continue
             response = input("              Do you want to overwrite it? (y/N): ")
             if response.lower() != 'y':
                 print("[INFO] Aborting conversion. No files were changed.")
@@ -463,22 +1298,28 @@ def main():
 
         # STEP 2: Check system requirements
         print_step(2, total_steps, "Checking System Requirements")
-        check_system_packages()
-
-        # From this point on, cleanup will be required on exit
-        cleanup_required = True
+        check_system_packages(assume_yes=args.yes)
 
-        # STEP 3: Create virtual environment
+        # STEP 3: Create virtual environment (or reuse the cached one).
+        # In --clean mode, cleanup will be required on exit from here on.
         print_step(3, total_steps, "Setting Up Virtual Environment")
-        create_virtual_environment()
+        needs_install = create_virtual_environment(persistent=not args.clean)
 
         # STEP 4: Install dependencies
         print_step(4, total_steps, "Installing Python Dependencies")
-        install_dependencies()
+        if needs_install:
+            install_dependencies()
+            if not args.clean:
+                mark_environment_ready()
+        else:
+            print("[INFO] Dependencies already installed in cached environment.")
 
         # STEP 5: Convert to PDF
         print_step(5, total_steps, "Converting Markdown to PDF")
-        convert_markdown_to_pdf(md_path, output_pdf_path)
+        if len(md_paths) == 1:
+            convert_markdown_to_pdf(md_paths[0], output_pdf_paths[0], parser=args.parser)
+        else:
+            convert_many(md_paths, workers=args.workers, parser=args.parser)
 
         # STEP 6: Cleanup
         print_step(6, total_steps, "Cleaning Up")
@@ -486,13 +1327,21 @@ def main():
 
         # Final success message
         print_header("Conversion Complete!")
-        print(f"[SUCCESS] PDF created: {output_pdf_path.resolve()}")
-        print(f"[SUCCESS] File size: {output_pdf_path.stat().st_size:,} bytes")
+        for output_pdf_path in output_pdf_paths:
+            print(f"[SUCCESS] PDF created: {output_pdf_path.resolve()}")
+            print(f"[SUCCESS] File size: {output_pdf_path.stat().st_size:,} bytes")
 
-    except (FileNotFoundError, PermissionError, ValueError) as e:
+    except InputFileError as e:
         print(f"\n[FATAL ERROR] Input file error: {e}")
         cleanup_environment()
         sys.exit(1)
+    except ConversionError as e:
+        print(f"\n[FATAL ERROR] PDF conversion failed: {e}")
+        if e.__cause__ is not None:
+            import traceback
+            traceback.print_exception(type(e.__cause__), e.__cause__, e.__cause__.__traceback__)
+        cleanup_environment()
+        sys.exit(1)
     except subprocess.CalledProcessError:
         print("\n[FATAL ERROR] A command failed to execute. See details above.")
         cleanup_environment()